@@ -1,7 +1,7 @@
 import botocore.exceptions
 import logging
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 
 from pyapp_ext.messaging.asyncio import bases
 from pyapp_ext.messaging.exceptions import QueueNotFound
@@ -13,6 +13,11 @@ __all__ = ("SQSSender", "SQSReceiver", "SNSSender")
 
 logger = logging.getLogger(__file__)
 
+# Maximum number of messages SQS will return/accept in a single batch request
+MAX_BATCH_SIZE = 10
+
+NON_EXISTENT_QUEUE = "AWS.SimpleQueueService.NonExistentQueue"
+
 
 def build_attributes(**attrs):
     attributes = {}
@@ -52,21 +57,26 @@ class SQSBase:
     async def open(self):
         """
         Open queue
+
+        The queue URL is resolved (confirming the queue exists) unless it is
+        already known from a preceding call to :meth:`configure`.
         """
         client = create_client("sqs", self.aws_config, **self.client_args)
 
-        try:
-            response = await client.get_queue_url(QueueName=self.queue_name)
-        except botocore.exceptions.ClientError as err:
-            await client.close()
-            error_code = err.response["Error"]["Code"]
-            if error_code == "AWS.SimpleQueueService.NonExistentQueue":
-                raise QueueNotFound(f"Unable to find queue `{self.queue_name}`")
-            else:
-                raise
+        if self._queue_url is None:
+            try:
+                response = await client.get_queue_url(QueueName=self.queue_name)
+            except botocore.exceptions.ClientError as err:
+                await client.close()
+                error_code = err.response.get("Error", {}).get("Code")
+                if error_code == NON_EXISTENT_QUEUE:
+                    raise QueueNotFound(f"Unable to find queue `{self.queue_name}`")
+                else:
+                    raise
+
+            self._queue_url = response["QueueUrl"]
 
         self._client = client
-        self._queue_url = response["QueueUrl"]
 
     async def close(self):
         """
@@ -82,17 +92,20 @@ class SQSBase:
         """
         Define any send queues
         """
-        client = create_client("sqs", self.aws_config, **self.client_args)
+        # Reuse the client of an open queue rather than creating another
+        owns_client = self._client is None
+        if owns_client:
+            client = create_client("sqs", self.aws_config, **self.client_args)
+        else:
+            client = self._client
 
         try:
             response = await client.create_queue(QueueName=self.queue_name)
-        except botocore.exceptions.ClientError as err:
-            error_code = err.response["Error"]["Code"]
-            raise
-        else:
-            return response["QueueUrl"]
+            self._queue_url = response["QueueUrl"]
+            return self._queue_url
         finally:
-            await client.close()
+            if owns_client:
+                await client.close()
 
 
 class SQSSender(SQSBase, bases.MessageSender):
@@ -120,9 +133,27 @@ class SQSSender(SQSBase, bases.MessageSender):
 class SQSReceiver(SQSBase, bases.MessageReceiver):
     """
     AIO SQS message receiver/subscriber
+
+    Up to ``batch_size`` messages are requested from SQS on each poll, messages
+    that have been handled are then removed with a single delete request. The
+    visibility timeout of every message in a batch starts when the batch is
+    received, so the queue visibility timeout must allow time for the entire
+    batch to be handled; otherwise handled messages will be delivered again.
     """
 
-    __slots__ = ()
+    __slots__ = ("batch_size",)
+
+    def __init__(
+        self,
+        queue_name: str,
+        aws_config: str = None,
+        client_args: Dict[str, Any] = None,
+        batch_size: int = 1,
+    ):
+        super().__init__(queue_name, aws_config, client_args)
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.batch_size = batch_size
 
     async def listen(self):
         """
@@ -136,27 +167,69 @@ class SQSReceiver(SQSBase, bases.MessageReceiver):
                 response = await client.receive_message(
                     QueueUrl=queue_url,
                     WaitTimeSeconds=10,
+                    MaxNumberOfMessages=self.batch_size,
                     MessageAttributeNames=["ContentType", "ContentEncoding"],
                 )
 
                 if "Messages" in response:
-                    for msg in response["Messages"]:
-                        attrs = parse_attributes(msg["MessageAttributes"])
-
-                        await self.receive(
-                            msg["Body"],
-                            attrs.get("ContentType"),
-                            attrs.get("ContentEncoding"),
-                        )
-                        await client.delete_message(
-                            QueueUrl=queue_url, ReceiptHandle=msg["ReceiptHandle"]
-                        )
+                    await self._receive_batch(client, queue_url, response["Messages"])
                 else:
                     logger.debug("No messages in queue")
 
             except botocore.exceptions.ClientError:
                 raise
 
+    async def _receive_batch(
+        self, client, queue_url: str, messages: Sequence[Dict[str, Any]]
+    ):
+        """
+        Handle a batch of messages and remove those handled from the queue.
+
+        If a handler raises the messages already handled are still removed, the
+        remainder are left on the queue to be delivered again.
+        """
+        handled = {}
+        try:
+            for msg in messages:
+                attrs = parse_attributes(msg["MessageAttributes"])
+
+                await self.receive(
+                    msg["Body"],
+                    attrs.get("ContentType"),
+                    attrs.get("ContentEncoding"),
+                )
+                handled[msg["MessageId"]] = msg["ReceiptHandle"]
+
+        except BaseException:
+            # Includes cancellation; do not allow a failed delete to mask the error
+            try:
+                await self._delete_messages(client, queue_url, handled)
+            except botocore.exceptions.ClientError:
+                logger.exception("Unable to delete handled messages")
+            raise
+
+        await self._delete_messages(client, queue_url, handled)
+
+    @staticmethod
+    async def _delete_messages(client, queue_url: str, handled: Dict[str, str]):
+        """
+        Delete handled messages (mapping of message ID to receipt handle).
+        """
+        if not handled:
+            return
+
+        response = await client.delete_message_batch(
+            QueueUrl=queue_url,
+            Entries=[
+                {"Id": message_id, "ReceiptHandle": receipt_handle}
+                for message_id, receipt_handle in handled.items()
+            ],
+        )
+        for failed in response.get("Failed", ()):
+            logger.warning(
+                "Unable to delete message %s: %s", failed["Id"], failed.get("Message")
+            )
+
 
 class SNSBase:
     """
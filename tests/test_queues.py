@@ -0,0 +1,270 @@
+import asyncio
+import logging
+
+import mock
+import pytest
+
+from botocore.exceptions import ClientError
+from pyapp_ext.messaging.exceptions import QueueNotFound
+
+from pyapp_ext.aiobotocore import queues
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def make_message(message_id: str) -> dict:
+    return {
+        "MessageId": message_id,
+        "ReceiptHandle": f"handle-{message_id}",
+        "Body": f"body-{message_id}",
+        "MessageAttributes": {
+            "ContentType": {"DataType": "String", "StringValue": "application/json"}
+        },
+    }
+
+
+@pytest.fixture
+def client():
+    client = mock.AsyncMock()
+    client.get_queue_url.return_value = {"QueueUrl": "http://queue/url"}
+    client.create_queue.return_value = {"QueueUrl": "http://queue/created"}
+    client.delete_message_batch.return_value = {"Successful": []}
+    return client
+
+
+@pytest.fixture
+def create_client(client):
+    with mock.patch.object(queues, "create_client", return_value=client) as target:
+        yield target
+
+
+class TestSQSBase:
+    def test_open(self, client, create_client):
+        target = queues.SQSSender("foo")
+
+        run(target.open())
+
+        client.get_queue_url.assert_awaited_once_with(QueueName="foo")
+        assert target._client is client
+        assert target._queue_url == "http://queue/url"
+
+    def test_open__url_known_from_configure(self, client, create_client):
+        target = queues.SQSSender("foo")
+
+        run(target.configure())
+        run(target.open())
+
+        client.get_queue_url.assert_not_awaited()
+        assert target._queue_url == "http://queue/created"
+
+    def test_open__resolved_again_after_close(self, client, create_client):
+        target = queues.SQSSender("foo")
+
+        run(target.open())
+        run(target.close())
+        run(target.open())
+
+        assert client.get_queue_url.await_count == 2
+
+    def test_configure__temporary_client(self, client, create_client):
+        target = queues.SQSSender("foo")
+
+        actual = run(target.configure())
+
+        assert actual == "http://queue/created"
+        create_client.assert_called_once_with("sqs", None)
+        client.create_queue.assert_awaited_once_with(QueueName="foo")
+        client.close.assert_awaited_once()
+
+    def test_configure__reuses_open_client(self, client, create_client):
+        target = queues.SQSSender("foo")
+        run(target.open())
+
+        run(target.configure())
+
+        create_client.assert_called_once()
+        client.create_queue.assert_awaited_once_with(QueueName="foo")
+        client.close.assert_not_awaited()
+        assert target._client is client
+
+    def test_configure__closed_during_create(self, client, create_client):
+        target = queues.SQSSender("foo")
+        run(target.open())
+
+        async def close_queue(**kwargs):
+            await target.close()
+            return {"QueueUrl": "http://queue/created"}
+
+        client.create_queue.side_effect = close_queue
+
+        run(target.configure())
+
+        client.close.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        "error_response, expected",
+        (
+            (
+                {"Error": {"Code": "AWS.SimpleQueueService.NonExistentQueue"}},
+                QueueNotFound,
+            ),
+            ({"Error": {"Code": "AccessDenied"}}, ClientError),
+            ({}, ClientError),
+        ),
+    )
+    def test_open__client_error(self, client, create_client, error_response, expected):
+        client.get_queue_url.side_effect = ClientError(error_response, "GetQueueUrl")
+        target = queues.SQSSender("foo")
+
+        with pytest.raises(expected):
+            run(target.open())
+
+        client.close.assert_awaited_once()
+        assert target._client is None
+        assert target._queue_url is None
+
+
+class TestSQSReceiver:
+    @pytest.fixture
+    def receive(self):
+        with mock.patch.object(
+            queues.SQSReceiver, "receive", new_callable=mock.AsyncMock
+        ) as target:
+            yield target
+
+    @pytest.mark.parametrize("batch_size", (0, 11))
+    def test_init__invalid_batch_size(self, batch_size):
+        with pytest.raises(ValueError):
+            queues.SQSReceiver("foo", batch_size=batch_size)
+
+    def test_listen__requests_batch_size(self, client, create_client, receive):
+        client.receive_message.side_effect = [
+            {"Messages": [make_message("a"), make_message("b")]},
+            ClientError({}, "ReceiveMessage"),
+        ]
+        target = queues.SQSReceiver("foo", batch_size=5)
+        run(target.open())
+
+        with pytest.raises(ClientError):
+            run(target.listen())
+
+        assert client.receive_message.await_args.kwargs["MaxNumberOfMessages"] == 5
+        assert receive.await_count == 2
+
+    def test_receive_batch(self, client, receive):
+        target = queues.SQSReceiver("foo")
+
+        run(
+            target._receive_batch(client, "url", [make_message("a"), make_message("b")])
+        )
+
+        receive.assert_has_awaits(
+            [
+                mock.call("body-a", "application/json", None),
+                mock.call("body-b", "application/json", None),
+            ]
+        )
+        client.delete_message_batch.assert_awaited_once_with(
+            QueueUrl="url",
+            Entries=[
+                {"Id": "a", "ReceiptHandle": "handle-a"},
+                {"Id": "b", "ReceiptHandle": "handle-b"},
+            ],
+        )
+
+    def test_receive_batch__handler_error(self, client, receive):
+        receive.side_effect = [None, ValueError("Handler failed")]
+        target = queues.SQSReceiver("foo")
+
+        with pytest.raises(ValueError):
+            run(
+                target._receive_batch(
+                    client, "url", [make_message("a"), make_message("b")]
+                )
+            )
+
+        client.delete_message_batch.assert_awaited_once_with(
+            QueueUrl="url", Entries=[{"Id": "a", "ReceiptHandle": "handle-a"}]
+        )
+
+    def test_receive_batch__cancelled(self, client, receive):
+        receive.side_effect = [None, asyncio.CancelledError()]
+        target = queues.SQSReceiver("foo", batch_size=3)
+
+        with pytest.raises(asyncio.CancelledError):
+            run(
+                target._receive_batch(
+                    client,
+                    "url",
+                    [make_message("a"), make_message("b"), make_message("c")],
+                )
+            )
+
+        client.delete_message_batch.assert_awaited_once_with(
+            QueueUrl="url", Entries=[{"Id": "a", "ReceiptHandle": "handle-a"}]
+        )
+
+    def test_receive_batch__handler_error_not_masked_by_delete(self, client, receive):
+        receive.side_effect = [None, ValueError("Handler failed")]
+        client.delete_message_batch.side_effect = ClientError({}, "DeleteMessageBatch")
+        target = queues.SQSReceiver("foo")
+
+        with pytest.raises(ValueError):
+            run(
+                target._receive_batch(
+                    client, "url", [make_message("a"), make_message("b")]
+                )
+            )
+
+    def test_receive_batch__first_handler_error(self, client, receive):
+        receive.side_effect = ValueError("Handler failed")
+        target = queues.SQSReceiver("foo")
+
+        with pytest.raises(ValueError):
+            run(target._receive_batch(client, "url", [make_message("a")]))
+
+        client.delete_message_batch.assert_not_awaited()
+
+    def test_receive_batch__failed_delete(self, client, receive, caplog):
+        client.delete_message_batch.return_value = {
+            "Successful": [{"Id": "a"}],
+            "Failed": [{"Id": "b", "SenderFault": False, "Message": "Oops"}],
+        }
+        target = queues.SQSReceiver("foo")
+
+        with caplog.at_level(logging.WARNING):
+            run(
+                target._receive_batch(
+                    client, "url", [make_message("a"), make_message("b")]
+                )
+            )
+
+        assert "Unable to delete message b: Oops" in caplog.text
+
+    def test_listen__closed_during_handler(self, client, create_client, receive):
+        target = queues.SQSReceiver("foo")
+
+        async def close_queue(*args):
+            await target.close()
+
+        receive.side_effect = close_queue
+        client.receive_message.side_effect = [
+            {"Messages": [make_message("a")]},
+            ClientError({}, "ReceiveMessage"),
+        ]
+        run(target.open())
+
+        with pytest.raises(ClientError):
+            run(target.listen())
+
+        assert target._client is None
+        client.delete_message_batch.assert_awaited_once_with(
+            QueueUrl="http://queue/url",
+            Entries=[{"Id": "a", "ReceiptHandle": "handle-a"}],
+        )